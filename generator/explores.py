@@ -1,23 +1,45 @@
 """All possible generated explores."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterator, List
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from typing import ClassVar, Dict, Iterator, List, Tuple
 
-from .views import PingView, View
+from .views import GrowthAccountingView, PingView, View
 
 
-@dataclass
+@dataclass(frozen=True)
 class Explore:
     """A generic explore."""
 
+    # dataclass(slots=True) requires python 3.10
+    __slots__ = ("name", "type", "views", "_dict")
+
     name: str
     type: str
-    views: Dict[str, str]
+    # pairs of (view role, view name), e.g. (("base_view", "baseline"),), which
+    # unlike a dict keeps explores hashable
+    views: Tuple[Tuple[str, str], ...]
+    # type of the views this explore is generated from
+    view_type: ClassVar[str]
+
+    def __getstate__(self) -> dict:
+        """Get fields to pickle or copy, skipping the cached dict."""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+    def __setstate__(self, state: dict):
+        """Restore fields from __getstate__, which frozen dataclasses reject."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def to_dict(self) -> dict:
         """Explore instance represented as a dict."""
-        return {self.name: {"type": self.type, "views": self.views}}
+        explore_dict = getattr(self, "_dict", None)
+        if explore_dict is None:
+            # explores are frozen, so the dict only needs to be built once
+            explore_dict = {self.name: {"type": self.type, "views": dict(self.views)}}
+            object.__setattr__(self, "_dict", explore_dict)
+        return explore_dict
 
     def to_lookml(self) -> dict:
         """Generate LookML for this explore."""
@@ -28,34 +50,62 @@ class Explore:
         """Get an instance of an explore from a namespace definition."""
         raise NotImplementedError("Only implemented in subclasses")
 
+    @staticmethod
+    def from_views(views: List[View]) -> Iterator[Explore]:
+        """Generate explores from views of this explore's view_type."""
+        raise NotImplementedError("Only implemented in subclasses")
 
-@dataclass
+    @staticmethod
+    def from_views_all(views: List[View]) -> Iterator[Explore]:
+        """Generate all possible explores from the views.
+
+        Views are grouped by type in a single pass, and each explore type is only
+        given the views of its view_type.
+        """
+        views_by_type: Dict[str, List[View]] = defaultdict(list)
+        for view in views:
+            views_by_type[view.view_type].append(view)
+
+        for klass in explore_types.values():
+            yield from klass.from_views(views_by_type[klass.view_type])
+
+
+@dataclass(frozen=True)
 class PingExplore(Explore):
     """A Ping Table explore."""
 
+    __slots__ = ()
+
+    view_type: ClassVar[str] = PingView.type
+
     def to_lookml(self) -> dict:
         """Generate LookML to represent this explore."""
+        # build a new dict each time, because lkml.dump consumes the "name" key
         return {
             "name": self.name,
-            "view_name": self.views["base_view"],
+            "view_name": dict(self.views)["base_view"],
         }
 
     @staticmethod
     def from_views(views: List[View]) -> Iterator[PingExplore]:
-        """Generate all possible PingExplores from the views."""
+        """Generate all possible PingExplores from ping views."""
         for view in views:
-            if view.view_type == PingView.type:
-                yield PingExplore(view.name, "ping_explore", {"base_view": view.name})
+            yield PingExplore(view.name, "ping_explore", (("base_view", view.name),))
 
     @staticmethod
     def from_dict(name: str, defn: dict) -> PingExplore:
         """Get an instance of this explore from a name and dictionary definition."""
-        return PingExplore(name, "ping_explore", defn["views"])
+        return PingExplore(name, "ping_explore", tuple(sorted(defn["views"].items())))
 
 
+@dataclass(frozen=True)
 class GrowthAccountingExplore(Explore):
     """A Growth Accounting Explore, from Baseline Clients Last Seen."""
 
+    __slots__ = ()
+
+    view_type: ClassVar[str] = GrowthAccountingView.type
+
     @staticmethod
     def from_views(views: List[View]) -> Iterator[GrowthAccountingExplore]:
         """
@@ -63,13 +113,13 @@ class GrowthAccountingExplore(Explore):
 
         Growth accounting explores are only created for growth_accounting views.
         """
-        for view in views:
-            if view.name == "growth_accounting":
-                yield GrowthAccountingExplore(
-                    "growth_accounting",
-                    "growth_accounting_explore",
-                    {"base_view": "growth_accounting"},
-                )
+        # there is at most one growth_accounting view, so stop at the first match
+        if any(view.name == "growth_accounting" for view in views):
+            yield GrowthAccountingExplore(
+                "growth_accounting",
+                "growth_accounting_explore",
+                (("base_view", "growth_accounting"),),
+            )
 
 
 explore_types = {
@@ -1,16 +1,18 @@
 """Generate lookml from namespaces."""
 import logging
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from itertools import filterfalse
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, Iterable, List, Tuple, TypedDict
 
 import click
 import lkml
-import yaml
 from google.cloud import bigquery
 
 from .explores import explore_types
+from .namespaces import load_namespaces
 
 BIGQUERY_TYPE_TO_DIMENSION_TYPE = {
     "BIGNUMERIC": "string",
@@ -26,6 +28,20 @@ BIGQUERY_TYPE_TO_DIMENSION_TYPE = {
     "TIMESTAMP": "time",
 }
 
+TIMEFRAMES = ["raw", "time", "date", "week", "month", "quarter", "year"]
+
+# parameters for dimension groups by bigquery type
+DIMENSION_GROUP_PARAMETERS: Dict[str, Dict[str, Any]] = {
+    "DATE": {
+        "timeframes": [timeframe for timeframe in TIMEFRAMES if timeframe != "time"],
+        "convert_tz": "no",
+        "datatype": "date",
+    },
+    "DATETIME": {"timeframes": TIMEFRAMES},
+    "TIME": {"timeframes": TIMEFRAMES},
+    "TIMESTAMP": {"timeframes": TIMEFRAMES},
+}
+
 HIDDEN_DIMENSIONS = {
     ("document_id",),
     ("client_id",),
@@ -60,19 +76,9 @@ def _get_dimension(path: Tuple[str, ...], field_type: str, mode: str) -> Dict[st
             # metadata__header__parsed. This is because the timeframe will add a _{type}
             # suffix to the individual dimension names.
             name = *path[:-1], re.sub("_(date|time(stamp)?)$", "", path[-1])
-            result["timeframes"] = [
-                "raw",
-                "time",
-                "date",
-                "week",
-                "month",
-                "quarter",
-                "year",
-            ]
-            if field_type == "DATE":
-                result["timeframes"].remove("time")
-                result["convert_tz"] = "no"
-                result["datatype"] = "date"
+            result.update(DIMENSION_GROUP_PARAMETERS[field_type])
+            # don't share the timeframes list between dimension groups
+            result["timeframes"] = list(result["timeframes"])
         if len(path) > 1:
             result["group_label"] = " ".join(path[:-1]).replace("_", " ").title()
             result["group_item_label"] = path[-1].replace("_", " ").title()
@@ -82,17 +88,59 @@ def _get_dimension(path: Tuple[str, ...], field_type: str, mode: str) -> Dict[st
     return result
 
 
-def _generate_dimensions_helper(
-    schema: List[bigquery.SchemaField], *prefix: str
-) -> Iterable[dict]:
-    for field in sorted(schema, key=lambda f: f.name):
+class _CachingClient:
+    """Wrap a bigquery.Client to look up each table at most once.
+
+    Table schemas don't change over the course of a run, so the lookml command uses
+    one instance per run to avoid repeated round trips to the BigQuery API.
+    """
+
+    def __init__(self, client: bigquery.Client):
+        """Create an instance wrapping a bigquery.Client."""
+        self.client = client
+        self.tables: Dict[str, Future] = {}
+        self.lock = Lock()
+
+    def get_table(self, table: str) -> bigquery.Table:
+        """Get a table from bigquery, reusing earlier lookups of the same table.
+
+        Concurrent lookups of the same table wait for the first one to finish instead
+        of each calling the API.
+        """
+        with self.lock:
+            is_first_lookup = table not in self.tables
+            if is_first_lookup:
+                self.tables[table] = Future()
+            future = self.tables[table]
+        if is_first_lookup:
+            try:
+                future.set_result(self.client.get_table(table))
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+
+
+def _generate_dimensions_helper(schema: List[bigquery.SchemaField]) -> Iterable[dict]:
+    # walk nested records depth first in order of field name, using a stack of
+    # (prefix, field) pairs instead of recursion
+    stack: List[Tuple[Tuple[str, ...], bigquery.SchemaField]] = [
+        ((), field) for field in sorted(schema, key=lambda f: f.name, reverse=True)
+    ]
+    while stack:
+        prefix, field = stack.pop()
+        path = (*prefix, field.name)
         if field.field_type == "RECORD" and not field.mode == "REPEATED":
-            yield from _generate_dimensions_helper(field.fields, *prefix, field.name)
+            stack.extend(
+                (path, sub_field)
+                for sub_field in sorted(
+                    field.fields, key=lambda f: f.name, reverse=True
+                )
+            )
         else:
-            yield _get_dimension((*prefix, field.name), field.field_type, field.mode)
+            yield _get_dimension(path, field.field_type, field.mode)
 
 
-def _generate_dimensions(client: bigquery.Client, table: str) -> List[Dict[str, Any]]:
+def _generate_dimensions(client: _CachingClient, table: str) -> List[Dict[str, Any]]:
     """Generate dimensions and dimension groups from a bigquery table.
 
     When schema contains both submission_timestamp and submission_date, only produce
@@ -206,11 +254,33 @@ def _generate_explores(
         yield path
 
 
+def _generate_namespace(
+    client: _CachingClient, target: Path, namespace: str, value: dict
+) -> None:
+    # namespaces are generated concurrently, so prefix logs with the namespace
+    logging.info(f"{namespace}: Generating namespace")
+
+    view_dir = target / namespace / "views"
+    view_dir.mkdir(parents=True, exist_ok=True)
+    views = value.get("views", {})
+
+    logging.info(f"{namespace}: Generating views")
+    for view_path in _generate_views(client, view_dir, views):
+        logging.info(f"{namespace}: ...Generating {view_path}")
+
+    explore_dir = target / namespace / "explores"
+    explore_dir.mkdir(parents=True, exist_ok=True)
+    explores = value.get("explores", {})
+    logging.info(f"{namespace}: Generating explores")
+    for explore_path in _generate_explores(client, explore_dir, namespace, explores):
+        logging.info(f"{namespace}: ...Generating {explore_path}")
+
+
 @click.command(help=__doc__)
 @click.option(
     "--namespaces",
     default="namespaces.yaml",
-    type=click.File(),
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
     help="Path to a yaml namespaces file",
 )
 @click.option(
@@ -221,25 +291,16 @@ def _generate_explores(
 )
 def lookml(namespaces, target_dir):
     """Generate lookml from namespaces."""
-    client = bigquery.Client()
-    _namespaces = yaml.safe_load(namespaces)
+    client = _CachingClient(bigquery.Client())
+    _namespaces = load_namespaces(Path(namespaces))
     target = Path(target_dir)
-    for namespace, value in _namespaces.items():
-        logging.info(f"\nGenerating namespace {namespace}")
-
-        view_dir = target / namespace / "views"
-        view_dir.mkdir(parents=True, exist_ok=True)
-        views = value.get("views", {})
-
-        logging.info("  Generating views")
-        for view_path in _generate_views(client, view_dir, views):
-            logging.info(f"    ...Generating {view_path}")
-
-        explore_dir = target / namespace / "explores"
-        explore_dir.mkdir(parents=True, exist_ok=True)
-        explores = value.get("explores", {})
-        logging.info("  Generating explores")
-        for explore_path in _generate_explores(
-            client, explore_dir, namespace, explores
-        ):
-            logging.info(f"    ...Generating {explore_path}")
+    # namespaces are independent and mostly wait on bigquery, so generate them
+    # concurrently
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(_generate_namespace, client, target, namespace, value)
+            for namespace, value in _namespaces.items()
+        ]
+        for future in futures:
+            # raise any errors from generating the namespace
+            future.result()
@@ -15,12 +15,56 @@ from typing import Dict, List, Union
 import click
 import yaml
 
-from .explores import explore_types
+from .explores import Explore
 from .views import View, view_types
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml isn't available
+    from yaml import SafeLoader  # type: ignore
+
 PROBE_INFO_BASE_URI = "https://probeinfo.telemetry.mozilla.org"
 
 
+def load_namespaces(path: Path) -> dict:
+    """Load a namespaces file, reusing a json cache of the parsed yaml if present.
+
+    The cache is written next to the namespaces file, and is only used when it was
+    generated from a namespaces file with the same modification time and size.
+    Namespaces read from stdin ("-") are never cached.
+    """
+    if str(path) == "-":
+        with click.open_file("-") as f:
+            return yaml.load(f, Loader=SafeLoader)
+
+    stat = path.stat()
+    # size guards against rewrites that keep the mtime, e.g. coarse timestamps or
+    # cp -p
+    mtime_ns, size = stat.st_mtime_ns, stat.st_size
+    cache_path = path.with_name(f"{path.name}.cache.json")
+    try:
+        cache = json.loads(cache_path.read_text())
+        if cache["mtime_ns"] == mtime_ns and cache["size"] == size:
+            return cache["namespaces"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass  # missing or invalid cache
+
+    namespaces = yaml.load(path.read_text(), Loader=SafeLoader)
+    try:
+        cache = json.dumps(
+            {"mtime_ns": mtime_ns, "size": size, "namespaces": namespaces}
+        )
+    except (TypeError, ValueError):
+        return namespaces  # not representable in json, e.g. dates
+    # only cache namespaces that json round trips exactly, e.g. not integer keys
+    if json.loads(cache)["namespaces"] == namespaces:
+        try:
+            cache_path.write_text(cache)
+        except OSError:
+            pass  # the cache is optional, e.g. for read-only directories
+    return namespaces
+
+
 def _get_first(tuple_):
     return tuple_[0]
 
@@ -32,7 +76,7 @@ def _get_db_views(uri):
     with tarfile.open(fileobj=tarbytes, mode="r:gz") as tar:
         for tarinfo in tar:
             if tarinfo.name.endswith("/metadata.yaml"):
-                metadata = yaml.safe_load(tar.extractfile(tarinfo.name))
+                metadata = yaml.load(tar.extractfile(tarinfo.name), Loader=SafeLoader)
                 references = metadata.get("references", {})
                 if "view.sql" not in references:
                     continue
@@ -118,9 +162,8 @@ def _get_looker_views(
 
 def _get_explores(views: List[View]) -> dict:
     explores = {}
-    for _, klass in explore_types.items():
-        for explore in klass.from_views(views):  # type: ignore
-            explores.update(explore.to_dict())
+    for explore in Explore.from_views_all(views):
+        explores.update(explore.to_dict())
 
     return explores
 
@@ -168,9 +211,9 @@ def namespaces(custom_namespaces, generated_sql_uri, app_listings_uri, allowlist
         }
 
     if custom_namespaces is not None:
-        namespaces.update(yaml.safe_load(custom_namespaces.read()) or {})
+        namespaces.update(yaml.load(custom_namespaces.read(), Loader=SafeLoader) or {})
 
-    allowed_namespaces = yaml.safe_load(allowlist.read())
+    allowed_namespaces = yaml.load(allowlist.read(), Loader=SafeLoader)
     namespaces = {
         name: defn for name, defn in namespaces.items() if name in allowed_namespaces
     }
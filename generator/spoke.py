@@ -5,9 +5,9 @@ from typing import Dict, List, TypedDict
 
 import click
 import lkml
-import yaml
 
 from .lookml import ViewDict
+from .namespaces import load_namespaces
 
 
 class ExploreDict(TypedDict):
@@ -62,13 +62,10 @@ def generate_directories(namespaces: Dict[str, NamespaceDict], spoke_dir: Path):
             # already generated, skip this namespace
             continue
 
-        (spoke_dir / namespace).mkdir()
-        (spoke_dir / namespace / "views").mkdir()
-        (spoke_dir / namespace / "views" / ".gitkeep").touch()
-        (spoke_dir / namespace / "explores").mkdir()
-        (spoke_dir / namespace / "explores" / ".gitkeep").touch()
-        (spoke_dir / namespace / "dashboards").mkdir()
-        (spoke_dir / namespace / "explores" / ".gitkeep").touch()
+        for sub_dir in ("views", "explores", "dashboards"):
+            path = spoke_dir / namespace / sub_dir
+            path.mkdir(parents=True, exist_ok=True)
+            (path / ".gitkeep").touch()
 
         generate_model(spoke_dir, namespace, defn)
 
@@ -77,7 +74,7 @@ def generate_directories(namespaces: Dict[str, NamespaceDict], spoke_dir: Path):
 @click.option(
     "--namespaces",
     default="namespaces.yaml",
-    type=click.File(),
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
     help="Path to the namespaces.yaml file.",
 )
 @click.option(
@@ -88,5 +85,5 @@ def generate_directories(namespaces: Dict[str, NamespaceDict], spoke_dir: Path):
 )
 def update_spoke(namespaces, spoke_dir):
     """Generate updates to spoke project."""
-    _namespaces = yaml.safe_load(namespaces)
+    _namespaces = load_namespaces(Path(namespaces))
     generate_directories(_namespaces, Path(spoke_dir))
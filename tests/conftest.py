@@ -1,5 +1,9 @@
 """PyTest configuration."""
 
+from functools import lru_cache
+from pathlib import Path
+
+import lkml
 import pytest
 
 
@@ -15,3 +19,18 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "integration" in item.keywords:
             item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session")
+def lkml_load():
+    """Parse lkml files, reusing results for files that haven't changed."""
+
+    @lru_cache(maxsize=128)
+    def _load(path: Path, mtime_ns: int) -> dict:
+        return lkml.load(path.read_text())
+
+    def load(path) -> dict:
+        path = Path(path).resolve()
+        return _load(path, path.stat().st_mtime_ns)
+
+    return load
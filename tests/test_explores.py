@@ -0,0 +1,59 @@
+import copy
+import pickle
+
+import lkml
+
+from generator.explores import Explore, GrowthAccountingExplore, PingExplore
+from generator.views import GrowthAccountingView, PingView
+
+
+def test_ping_explore_from_dict():
+    defn = {"type": "ping_explore", "views": {"base_view": "baseline"}}
+    explore = PingExplore.from_dict("baseline", defn)
+    assert explore == PingExplore(
+        "baseline", "ping_explore", (("base_view", "baseline"),)
+    )
+    assert explore.to_lookml() == {"name": "baseline", "view_name": "baseline"}
+    # rendering doesn't change the lookml of later renders
+    assert lkml.dump(explore.to_lookml()) == lkml.dump(explore.to_lookml())
+    # explores are hashable
+    assert {explore} == {PingExplore("baseline", "ping_explore", explore.views)}
+
+
+def test_to_dict():
+    explore = PingExplore("baseline", "ping_explore", (("base_view", "baseline"),))
+    expected = {
+        "baseline": {"type": "ping_explore", "views": {"base_view": "baseline"}}
+    }
+    assert explore.to_dict() == expected
+    assert explore.to_dict() is explore.to_dict()
+    assert repr(explore) == (
+        "PingExplore(name='baseline', type='ping_explore', "
+        "views=(('base_view', 'baseline'),))"
+    )
+
+
+def test_from_views_all():
+    views = [
+        PingView("baseline", [{"table": "mozdata.glean_app.baseline"}]),
+        GrowthAccountingView([{"table": "mozdata.glean_app.baseline_clients_daily"}]),
+        PingView("metrics", [{"table": "mozdata.glean_app.metrics"}]),
+    ]
+    assert list(Explore.from_views_all(views)) == [
+        PingExplore("baseline", "ping_explore", (("base_view", "baseline"),)),
+        PingExplore("metrics", "ping_explore", (("base_view", "metrics"),)),
+        GrowthAccountingExplore(
+            "growth_accounting",
+            "growth_accounting_explore",
+            (("base_view", "growth_accounting"),),
+        ),
+    ]
+
+
+def test_copy_and_pickle():
+    explore = PingExplore("baseline", "ping_explore", (("base_view", "baseline"),))
+    explore.to_dict()
+    for clone in (copy.copy(explore), pickle.loads(pickle.dumps(explore))):
+        assert clone == explore
+        assert clone.to_dict() == explore.to_dict()
+        assert clone.to_dict() is not explore.to_dict()
@@ -1,9 +1,9 @@
 import sys
+import time
 from pathlib import Path
 from textwrap import dedent
 from unittest.mock import patch
 
-import lkml
 import pytest
 from click.testing import CliRunner
 from google.cloud import bigquery
@@ -16,96 +16,94 @@ def runner():
     return CliRunner()
 
 
-class MockClient:
-    """Mock bigquery.Client."""
-
-    def get_table(self, table_ref):
-        """Mock bigquery.Client.get_table."""
-
-        if table_ref == "mozdata.custom.baseline":
-            return bigquery.Table(
-                table_ref,
-                schema=[
+_MOCK_TABLES = {
+    "mozdata.custom.baseline": bigquery.Table(
+        "mozdata.custom.baseline",
+        schema=[
+            bigquery.schema.SchemaField("client_id", "STRING"),
+            bigquery.schema.SchemaField("country", "STRING"),
+            bigquery.schema.SchemaField("document_id", "STRING"),
+        ],
+    ),
+    "mozdata.glean_app.baseline": bigquery.Table(
+        "mozdata.glean_app.baseline",
+        schema=[
+            bigquery.schema.SchemaField(
+                "client_info",
+                "RECORD",
+                fields=[
                     bigquery.schema.SchemaField("client_id", "STRING"),
-                    bigquery.schema.SchemaField("country", "STRING"),
-                    bigquery.schema.SchemaField("document_id", "STRING"),
+                    bigquery.schema.SchemaField("parsed_first_run_date", "DATE"),
                 ],
-            )
-        if table_ref == "mozdata.glean_app.baseline":
-            return bigquery.Table(
-                table_ref,
-                schema=[
+            ),
+            bigquery.schema.SchemaField(
+                "metadata",
+                "RECORD",
+                fields=[
                     bigquery.schema.SchemaField(
-                        "client_info",
+                        "geo",
                         "RECORD",
                         fields=[
-                            bigquery.schema.SchemaField("client_id", "STRING"),
-                            bigquery.schema.SchemaField(
-                                "parsed_first_run_date", "DATE"
-                            ),
+                            bigquery.schema.SchemaField("country", "STRING"),
                         ],
                     ),
                     bigquery.schema.SchemaField(
-                        "metadata",
+                        "header",
                         "RECORD",
                         fields=[
-                            bigquery.schema.SchemaField(
-                                "geo",
-                                "RECORD",
-                                fields=[
-                                    bigquery.schema.SchemaField("country", "STRING"),
-                                ],
-                            ),
-                            bigquery.schema.SchemaField(
-                                "header",
-                                "RECORD",
-                                fields=[
-                                    bigquery.schema.SchemaField("date", "STRING"),
-                                    bigquery.schema.SchemaField(
-                                        "parsed_date", "TIMESTAMP"
-                                    ),
-                                ],
-                            ),
+                            bigquery.schema.SchemaField("date", "STRING"),
+                            bigquery.schema.SchemaField("parsed_date", "TIMESTAMP"),
                         ],
                     ),
-                    bigquery.schema.SchemaField("parsed_timestamp", "TIMESTAMP"),
-                    bigquery.schema.SchemaField("submission_timestamp", "TIMESTAMP"),
-                    bigquery.schema.SchemaField("submission_date", "DATE"),
-                    bigquery.schema.SchemaField("test_bignumeric", "BIGNUMERIC"),
-                    bigquery.schema.SchemaField("test_bool", "BOOLEAN"),
-                    bigquery.schema.SchemaField("test_bytes", "BYTES"),
-                    bigquery.schema.SchemaField("test_float64", "FLOAT"),
-                    bigquery.schema.SchemaField("test_int64", "INTEGER"),
-                    bigquery.schema.SchemaField("test_numeric", "NUMERIC"),
-                    bigquery.schema.SchemaField("test_string", "STRING"),
                 ],
-            )
-        if table_ref == "mozdata.fail.duplicate_dimension":
-            return bigquery.Table(
-                table_ref,
-                schema=[
-                    bigquery.schema.SchemaField("parsed_timestamp", "TIMESTAMP"),
-                    bigquery.schema.SchemaField("parsed_date", "DATE"),
-                ],
-            )
-        if table_ref == "mozdata.fail.duplicate_measure":
-            return bigquery.Table(
-                table_ref,
-                schema=[
-                    bigquery.schema.SchemaField(
-                        "client_info",
-                        "RECORD",
-                        fields=[
-                            bigquery.schema.SchemaField("client_id", "STRING"),
-                        ],
-                    ),
+            ),
+            bigquery.schema.SchemaField("parsed_timestamp", "TIMESTAMP"),
+            bigquery.schema.SchemaField("submission_timestamp", "TIMESTAMP"),
+            bigquery.schema.SchemaField("submission_date", "DATE"),
+            bigquery.schema.SchemaField("test_bignumeric", "BIGNUMERIC"),
+            bigquery.schema.SchemaField("test_bool", "BOOLEAN"),
+            bigquery.schema.SchemaField("test_bytes", "BYTES"),
+            bigquery.schema.SchemaField("test_float64", "FLOAT"),
+            bigquery.schema.SchemaField("test_int64", "INTEGER"),
+            bigquery.schema.SchemaField("test_numeric", "NUMERIC"),
+            bigquery.schema.SchemaField("test_string", "STRING"),
+        ],
+    ),
+    "mozdata.fail.duplicate_dimension": bigquery.Table(
+        "mozdata.fail.duplicate_dimension",
+        schema=[
+            bigquery.schema.SchemaField("parsed_timestamp", "TIMESTAMP"),
+            bigquery.schema.SchemaField("parsed_date", "DATE"),
+        ],
+    ),
+    "mozdata.fail.duplicate_measure": bigquery.Table(
+        "mozdata.fail.duplicate_measure",
+        schema=[
+            bigquery.schema.SchemaField(
+                "client_info",
+                "RECORD",
+                fields=[
                     bigquery.schema.SchemaField("client_id", "STRING"),
                 ],
-            )
-        raise ValueError(f"Table not found: {table_ref}")
+            ),
+            bigquery.schema.SchemaField("client_id", "STRING"),
+        ],
+    ),
+}
+
+
+class MockClient:
+    """Mock bigquery.Client."""
+
+    def get_table(self, table_ref):
+        """Mock bigquery.Client.get_table."""
+        try:
+            return _MOCK_TABLES[table_ref]
+        except KeyError:
+            raise ValueError(f"Table not found: {table_ref}")
 
 
-def test_lookml(runner, tmp_path):
+def test_lookml(runner, tmp_path, lkml_load):
     namespaces = tmp_path / "namespaces.yaml"
     namespaces.write_text(
         dedent(
@@ -189,7 +187,7 @@ def test_lookml(runner, tmp_path):
                     ],
                 }
             ]
-        } == lkml.load(Path("looker-hub/custom/views/baseline.view.lkml").read_text())
+        } == lkml_load("looker-hub/custom/views/baseline.view.lkml")
         assert {
             "views": [
                 {
@@ -340,9 +338,7 @@ def test_lookml(runner, tmp_path):
                     ],
                 }
             ]
-        } == lkml.load(
-            Path("looker-hub/glean-app/views/baseline.view.lkml").read_text()
-        )
+        } == lkml_load("looker-hub/glean-app/views/baseline.view.lkml")
         assert {
             "includes": "/looker-hub/glean-app/views/*.view.lkml",
             "explores": [
@@ -351,9 +347,7 @@ def test_lookml(runner, tmp_path):
                     "view_name": "baseline",
                 }
             ],
-        } == lkml.load(
-            Path("looker-hub/glean-app/explores/baseline.explore.lkml").read_text()
-        )
+        } == lkml_load("looker-hub/glean-app/explores/baseline.explore.lkml")
 
 
 def test_duplicate_dimension(runner, tmp_path):
@@ -418,3 +412,128 @@ def test_duplicate_measure(runner, tmp_path):
             " for table 'mozdata.fail.duplicate_measure'\n"
         ) == result.output
         assert result.exit_code != 0
+
+
+def test_get_table_cached(runner, tmp_path):
+    mock_get_table = MockClient.get_table
+
+    def slow_get_table(self, table_ref):
+        # give concurrently generated namespaces time to request the same table
+        time.sleep(0.2)
+        return mock_get_table(self, table_ref)
+
+    namespaces = tmp_path / "namespaces.yaml"
+    namespaces.write_text(
+        dedent(
+            """
+            custom:
+              canonical_app_name: Custom
+              views:
+                baseline:
+                  type: ping_view
+                  tables:
+                  - channel: release
+                    table: mozdata.custom.baseline
+            custom-copy:
+              canonical_app_name: Custom Copy
+              views:
+                baseline:
+                  type: ping_view
+                  tables:
+                  - channel: release
+                    table: mozdata.custom.baseline
+            """
+        )
+    )
+    with runner.isolated_filesystem():
+        with patch("google.cloud.bigquery.Client", MockClient), patch.object(
+            MockClient, "get_table", autospec=True, side_effect=slow_get_table
+        ) as get_table:
+            result = runner.invoke(
+                lookml,
+                [
+                    "--namespaces",
+                    namespaces,
+                ],
+            )
+        assert result.exit_code == 0
+        get_table.assert_called_once()
+
+
+def test_namespaces_stdin(runner):
+    with runner.isolated_filesystem():
+        with patch("google.cloud.bigquery.Client", MockClient):
+            result = runner.invoke(
+                lookml,
+                ["--namespaces", "-"],
+                input=dedent(
+                    """
+                    custom:
+                      canonical_app_name: Custom
+                      views:
+                        baseline:
+                          type: ping_view
+                          tables:
+                          - channel: release
+                            table: mozdata.custom.baseline
+                    """
+                ),
+            )
+        assert result.exit_code == 0
+        assert Path("looker-hub/custom/views/baseline.view.lkml").is_file()
+
+
+def test_duplicate_explore_definitions(runner, tmp_path, lkml_load):
+    namespaces = tmp_path / "namespaces.yaml"
+    namespaces.write_text(
+        dedent(
+            """
+            custom:
+              canonical_app_name: Custom
+              views:
+                baseline:
+                  type: ping_view
+                  tables:
+                  - channel: release
+                    table: mozdata.custom.baseline
+              explores:
+                baseline:
+                  type: ping_explore
+                  views:
+                    base_view: baseline
+            custom-copy:
+              canonical_app_name: Custom Copy
+              views:
+                baseline:
+                  type: ping_view
+                  tables:
+                  - channel: release
+                    table: mozdata.custom.baseline
+              explores:
+                baseline:
+                  type: ping_explore
+                  views:
+                    base_view: baseline
+            """
+        )
+    )
+    with runner.isolated_filesystem():
+        with patch("google.cloud.bigquery.Client", MockClient):
+            result = runner.invoke(
+                lookml,
+                [
+                    "--namespaces",
+                    namespaces,
+                ],
+            )
+        assert result.exit_code == 0
+        for namespace in ("custom", "custom-copy"):
+            assert {
+                "includes": f"/looker-hub/{namespace}/views/*.view.lkml",
+                "explores": [
+                    {
+                        "name": "baseline",
+                        "view_name": "baseline",
+                    }
+                ],
+            } == lkml_load(f"looker-hub/{namespace}/explores/baseline.explore.lkml")
@@ -1,7 +1,9 @@
 import gzip
 import json
+import os
 import sys
 import tarfile
+from datetime import date
 from io import BytesIO
 from pathlib import Path
 from textwrap import dedent
@@ -13,6 +15,7 @@ from generator.namespaces import (
     _get_db_views,
     _get_glean_apps,
     _get_looker_views,
+    load_namespaces,
     namespaces,
 )
 from generator.views import GrowthAccountingView, PingView
@@ -247,3 +250,51 @@ def test_get_looker_views(glean_apps, generated_sql_uri):
             ]
         ),
     ]
+
+
+def test_load_namespaces_cache(custom_namespaces):
+    cache = custom_namespaces.with_name("custom-namespaces.yaml.cache.json")
+    expected = load_namespaces(custom_namespaces)
+    assert expected["custom"]["canonical_app_name"] == "Custom"
+    assert json.loads(cache.read_text())["namespaces"] == expected
+
+    # unchanged namespaces are read from the cache
+    stat = custom_namespaces.stat()
+    mtime_ns = stat.st_mtime_ns
+    cache.write_text(
+        json.dumps(
+            {"mtime_ns": mtime_ns, "size": stat.st_size, "namespaces": {"cached": {}}}
+        )
+    )
+    assert load_namespaces(custom_namespaces) == {"cached": {}}
+
+    # modified namespaces invalidate the cache
+    os.utime(custom_namespaces, ns=(mtime_ns, mtime_ns + 1))
+    assert load_namespaces(custom_namespaces) == expected
+
+    # so do rewrites that keep the modification time
+    custom_namespaces.write_text("custom:\n  canonical_app_name: Changed\n")
+    os.utime(custom_namespaces, ns=(mtime_ns, mtime_ns + 1))
+    assert load_namespaces(custom_namespaces) == {
+        "custom": {"canonical_app_name": "Changed"}
+    }
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        # json can't represent dates
+        (
+            "custom:\n  owner_since: 2021-01-01\n",
+            {"custom": {"owner_since": date(2021, 1, 1)}},
+        ),
+        # json would turn integer keys into strings
+        ("custom:\n  1: x\n", {"custom": {1: "x"}}),
+    ],
+)
+def test_load_namespaces_not_cached(tmp_path, content, expected):
+    path = tmp_path / "namespaces.yaml"
+    path.write_text(content)
+    assert load_namespaces(path) == expected
+    assert not (tmp_path / "namespaces.yaml.cache.json").exists()
+    assert load_namespaces(path) == expected
@@ -1,4 +1,3 @@
-import lkml
 import pytest
 
 from generator.spoke import generate_directories
@@ -40,6 +39,8 @@ def test_generate_directories(namespaces, tmp_path):
         app_path / "dashboards",
         app_path / "glean-app.model.lkml",
     }
+    for sub_dir in ("views", "explores", "dashboards"):
+        assert (app_path / sub_dir / ".gitkeep").is_file()
 
 
 def test_existing_dir(namespaces, tmp_path):
@@ -53,7 +54,7 @@ def test_existing_dir(namespaces, tmp_path):
     assert tmp_file.is_file()
 
 
-def test_generate_model(namespaces, tmp_path):
+def test_generate_model(namespaces, tmp_path, lkml_load):
     generate_directories(namespaces, tmp_path)
     expected = {
         "connection": "telemetry",
@@ -66,5 +67,5 @@ def test_generate_model(namespaces, tmp_path):
             "dashboards/*",
         ],
     }
-    actual = lkml.load((tmp_path / "glean-app" / "glean-app.model.lkml").read_text())
+    actual = lkml_load(tmp_path / "glean-app" / "glean-app.model.lkml")
     assert expected == actual